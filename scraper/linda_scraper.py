@@ -1,22 +1,43 @@
 import os
 import re
+import sys
+import gzip
 import time
+import shutil
 import datetime
 import smtplib
 import traceback
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
-from email import encoders
+from functools import lru_cache, partial
+from importlib.util import find_spec
+from email.message import EmailMessage
+from multiprocessing import Lock, Pool, Value
+from multiprocessing.util import Finalize
 from urllib.parse import urljoin
 
+import numpy as np
 import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import TimeoutException
+
+try:
+    import httpx
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    HTTP_IMPORT_ERROR = None
+except ImportError as e:    # HTTP fast path unavailable — every page goes through Chrome
+    httpx = None
+    HTTP_IMPORT_ERROR = e
+
+# httpx only speaks HTTP/2 when h2 is installed; without it the client stays on HTTP/1.1
+HTTP2 = find_spec("h2") is not None
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # ================= CONFIG =================
 BASE_URL    = "https://www.lindacars.com"
@@ -26,6 +47,19 @@ WAIT_PAGE   = 10    # seconds to wait for listing page
 WAIT_AD     = 5    # seconds to wait for ad detail page (reduced)
 MAX_RETRIES = 2     # retries per ad (reduced from 3)
 RETRY_WAIT  = 2     # seconds between retries (reduced from 3)
+NUM_WORKERS = 4     # parallel Chrome processes for ad scraping
+SKIP_UNCHANGED = True   # reuse last run's row when the listing tile shows the same price
+SHARED_BROWSER = True   # browser-only runs: one Chrome for all workers, one tab each
+HTTP_TIMEOUT = 15   # seconds per plain-HTTP request
+
+# Force Selenium for every page; otherwise pages are fetched over plain HTTP
+# first and Chrome is only started for pages that need JavaScript to render.
+USE_BROWSER = os.environ.get("USE_BROWSER", "false").lower() == "true"
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    "Accept-Language": "en",
+}
 
 # Chrome profile — local PC only, ignored on GitHub Actions
 CHROME_PROFILE = r"C:\Users\User\AppData\Local\Google\Chrome\User Data\Selenium_Linda"
@@ -49,16 +83,53 @@ def log(msg):
 # =====================================================================
 # IMAGE URL TRANSFORM
 # =====================================================================
-def transform_image_url(url: str) -> str:
-    return re.sub(r'fit-\d+xauto', 'fit-1324xauto', url)
+IMG_FIT_RE    = re.compile(r'fit-\d+xauto')
+THUMB_HASH_RE = re.compile(r'/thumbs/([a-f0-9]+)/')
+
+
+@lru_cache(maxsize=8192)
+def normalize_image_url(url: str):
+    """Returns (full-size url, dedup key).
+
+    The key is the thumbnail hash, or the full url when it has none. Cached
+    per worker, so dealer stock photos repeated across ads are parsed once.
+    """
+    full_url = IMG_FIT_RE.sub('fit-1324xauto', url) if "fit-" in url else url
+    m = THUMB_HASH_RE.search(full_url)
+    return full_url, m.group(1) if m else full_url
 
 
 # =====================================================================
-# CHROME DRIVER — single instance, reused for all ads
+# CHROME DRIVER — one instance per process, reused for all its ads
 # =====================================================================
-def init_driver() -> webdriver.Chrome:
+# Pixels, fonts and media are never needed — img src attributes are set before
+# the request. Stylesheets stay on: innerText / .text depend on computed style
+# (hidden duplicates, line breaks, text-transform), so blocking CSS could
+# change scraped values.
+# Trailing * so CDN URLs with a query string (x.jpg?w=400) match as well
+BLOCKED_URLS = ["*.jpg*", "*.jpeg*", "*.png*", "*.webp*", "*.gif*", "*.svg*",
+                "*.woff*", "*.ttf*", "*.mp4*"]
+CONTENT_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+}
+
+
+def init_driver(worker_id: int = 0, debugger_address: str = None) -> webdriver.Chrome:
+    """Launches Chrome, or attaches to an already running one in a new tab.
+
+    Launch options can't be changed on an attached browser, so they are only
+    set when this call starts Chrome itself.
+    """
     opts = Options()
 
+    if debugger_address:
+        opts.debugger_address = debugger_address
+        driver = webdriver.Chrome(options=opts)
+        driver.switch_to.new_window("tab")
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+        return driver
+
     if IS_CI:
         opts.add_argument("--headless=new")
         opts.add_argument("--no-sandbox")
@@ -71,14 +142,51 @@ def init_driver() -> webdriver.Chrome:
         opts.add_argument("--blink-settings=imagesEnabled=false")
         opts.add_argument("--js-flags=--max-old-space-size=512")
     else:
-        opts.add_argument(f"user-data-dir={CHROME_PROFILE}_worker0")
+        opts.add_argument(f"user-data-dir={CHROME_PROFILE}_worker{worker_id}")
         opts.add_argument("--start-maximized")
 
     opts.add_argument("--disable-blink-features=AutomationControlled")
+    # Worker tabs of a shared browser sit in the background; don't throttle them
+    opts.add_argument("--disable-background-timer-throttling")
+    opts.add_argument("--disable-backgrounding-occluded-windows")
+    opts.add_argument("--disable-renderer-backgrounding")
     opts.add_experimental_option("excludeSwitches", ["enable-automation"])
     opts.add_experimental_option("useAutomationExtension", False)
+    opts.add_experimental_option("prefs", CONTENT_PREFS)
 
-    return webdriver.Chrome(options=opts)
+    driver = webdriver.Chrome(options=opts)
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    return driver
+
+
+# =====================================================================
+# HTTP CLIENT — plain requests, no browser
+# =====================================================================
+def init_http_client():
+    """Returns a pooled HTTP client (HTTP/2 when h2 is installed), or None when
+    the browser must be used."""
+    if USE_BROWSER or httpx is None:
+        return None
+    return httpx.Client(
+        http2=HTTP2,
+        headers=HTTP_HEADERS,
+        timeout=HTTP_TIMEOUT,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=32),
+    )
+
+
+def fetch_html(client, url: str) -> str:
+    resp = client.get(url)
+    resp.raise_for_status()
+    return resp.text
+
+
+def node_text(node) -> str:
+    """Whitespace-normalised text of a parsed node — the same string AD_PAGE_JS's
+    txt() gives for it in Chrome."""
+    return " ".join(node.text(separator="").split())
 
 
 # =====================================================================
@@ -93,51 +201,87 @@ def wait_for_ads_on_page(driver):
         log("  [!] Timed out waiting for listing page.")
 
 
+# One script evaluation per poll instead of one find_element per selector
+AD_READY_JS = ("return document.readyState === 'complete' && "
+               "document.querySelector('span.p-brand, span.p-name, .MuiCardContent-root, data') !== null;")
+
+
 def wait_for_ad_detail(driver) -> bool:
-    """Returns True as soon as any content selector appears."""
-    CANDIDATES = ["span.p-brand", "span.p-name", ".MuiCardContent-root", "data"]
-    deadline = time.time() + WAIT_AD
-    while time.time() < deadline:
-        for sel in CANDIDATES:
-            try:
-                if driver.find_element(By.CSS_SELECTOR, sel):
-                    return True
-            except Exception:
-                pass
-        time.sleep(0.3)
-    return False
+    """Returns True as soon as the page has loaded and any content selector appears."""
+    try:
+        WebDriverWait(driver, WAIT_AD, poll_frequency=0.05).until(
+            lambda d: d.execute_script(AD_READY_JS)
+        )
+        return True
+    except TimeoutException:
+        return False
 
 
 # =====================================================================
 # URL COLLECTION
 # =====================================================================
-def collect_ad_urls(driver) -> list:
-    ads, seen = [], set()
-    page = 0
+# (href, price) for every tile on a rendered listing page, in one round-trip
+TILES_JS = r"""
+return [...document.querySelectorAll('a.dd-product-tile')].map(a => {
+    const price = a.querySelector('data');
+    return [a.href, price ? (price.getAttribute('value') || price.innerText.trim()) : ''];
+});
+"""
+
+
+def page_tiles_http(client, url: str) -> list:
+    tiles = []
+    for a in HTMLParser(fetch_html(client, url)).css("a.dd-product-tile"):
+        price_el = a.css_first("data")
+        price = (price_el.attributes.get("value") or node_text(price_el)) if price_el is not None else ""
+        tiles.append((a.attributes.get("href"), price))
+    return tiles
+
+
+def page_tiles_browser(driver, url: str) -> list:
+    driver.get(url)
+    wait_for_ads_on_page(driver)
+    return driver.execute_script(TILES_JS)
+
+
+def ad_url_from_href(href: str) -> str:
+    return urljoin(BASE_URL, href.split("?")[0])
+
+
+def tile_urls(tiles) -> set:
+    return {ad_url_from_href(href) for href, _ in tiles if href}
+
+
+def collect_ad_urls(pool) -> dict:
+    """Fetches listing pages NUM_WORKERS at a time until a page yields no new ads.
+
+    Returns {ad_url: price shown on its listing tile} in listing order.
+    Pages go over plain HTTP only after _check_http_listing has confirmed
+    that HTTP and Chrome agree on the listing; otherwise all go through Chrome.
+    """
+    use_http = not USE_BROWSER and httpx is not None and pool.apply(_check_http_listing)
+    log(f"  Listing pages via {'HTTP' if use_http else 'Chrome'}.")
+
+    ads         = {}
+    batch_start = 0
     while True:
-        url = f"{START_URL}{page}"
-        log(f"  Collecting page {page}: {url}")
-        driver.get(url)
-        wait_for_ads_on_page(driver)
-
-        links = driver.find_elements(By.CSS_SELECTOR, "a.dd-product-tile")
-        new_count = 0
-        for link in links:
-            href = link.get_attribute("href")
-            if href:
-                full = urljoin(BASE_URL, href.split("?")[0])
-                if full not in seen:
-                    seen.add(full)
-                    ads.append(full)
-                    new_count += 1
-
-        log(f"    -> {new_count} new ads on page {page} (total: {len(ads)})")
-        if new_count == 0:
-            log(f"  No new ads on page {page} — stopping.")
-            break
-        page += 1
-
-    return ads
+        pages = range(batch_start, batch_start + NUM_WORKERS)
+        batch = pool.starmap(_collect_page, [(page, use_http) for page in pages])
+
+        # Merge in page order so the stop rule matches a sequential crawl
+        for page, tiles in zip(pages, batch):
+            new_count = 0
+            for href, price in tiles:
+                if href:
+                    full = ad_url_from_href(href)
+                    if full not in ads:
+                        ads[full] = price
+                        new_count += 1
+            log(f"    -> {new_count} new ads on page {page} (total: {len(ads)})")
+            if new_count == 0:
+                log(f"  No new ads on page {page} — stopping.")
+                return ads
+        batch_start += NUM_WORKERS
 
 
 # =====================================================================
@@ -172,43 +316,8 @@ LABEL_MAP = {
     "emission standard"   : "EmissionStandard",
     "emission co2"        : "EmissionCO2",
 }
-
-
-def safe_get(driver, selector) -> str:
-    try:
-        return driver.find_element(By.CSS_SELECTOR, selector).text.strip()
-    except NoSuchElementException:
-        return ""
-
-
-def extract_label(row) -> str:
-    try:
-        label_el    = row.find_element(By.CSS_SELECTOR, "span.MuiTypography-body2")
-        label_spans = label_el.find_elements(By.CSS_SELECTOR, "span")
-        if label_spans:
-            return label_spans[-1].text.strip().lower()
-        return label_el.text.strip().lower()
-    except Exception:
-        return ""
-
-
-def extract_value(row, label: str) -> str:
-    try:
-        value_el = row.find_element(By.CSS_SELECTOR, "span.MuiTypography-body1")
-        if label == "body color":
-            try:
-                return value_el.find_element(
-                    By.CSS_SELECTOR, "span.MuiTypography-body2"
-                ).text.strip()
-            except Exception:
-                pass
-        if label == "body type":
-            boxes = value_el.find_elements(By.CSS_SELECTOR, "div.MuiBox-root")
-            if boxes:
-                return " ".join(b.text.strip() for b in boxes if b.text.strip())
-        return value_el.text.strip()
-    except Exception:
-        return ""
+LABEL_MAP  = {sys.intern(k): v for k, v in LABEL_MAP.items()}
+_LABEL_SET = frozenset(LABEL_MAP)
 
 
 def split_fuel_engine(raw: str):
@@ -218,154 +327,259 @@ def split_fuel_engine(raw: str):
     return "", raw.strip()
 
 
-def read_all_specs(driver) -> dict:
-    specs = {}
-    try:
-        rows = driver.find_elements(By.CSS_SELECTOR, ".MuiCardContent-root .mui-1d58shw")
-        for row in rows:
-            try:
-                label = extract_label(row)
-                if not label:
-                    continue
-
-                if label == "model":
-                    try:
-                        value_el  = row.find_element(By.CSS_SELECTOR, "span.MuiTypography-body1")
-                        make_span = value_el.find_element(By.CSS_SELECTOR, "span.p-brand")
-                        make_text = make_span.text.strip()
-                        full_text  = value_el.text.strip()
-                        if make_text and "MakeFromRow" not in specs:
-                            specs["MakeFromRow"] = make_text
-                        if "ModelSuffix" not in specs:
-                            specs["ModelSuffix"] = full_text.replace(make_text, "").strip()
-                    except Exception:
-                        pass
-                    continue
-
-                value = extract_value(row, label)
-                if not value:
-                    continue
-
-                if label == "engine":
-                    fuel, engine_size = split_fuel_engine(value)
-                    if fuel and "Fuel" not in specs:
-                        specs["Fuel"] = fuel
-                    if engine_size and "Engine" not in specs:
-                        specs["Engine"] = engine_size
-                    continue
-
-                col = LABEL_MAP.get(label)
-                if col and col not in specs:
-                    specs[col] = value
-            except Exception:
-                continue
-    except Exception:
-        pass
-
-    # Fallback for Year & Mileage
-    if "Year" not in specs or "Mileage" not in specs:
-        try:
-            for span in driver.find_elements(By.CSS_SELECTOR, ".MuiCardContent-root span.MuiTypography-body1"):
-                try:
-                    text = span.text.strip()
-                    if not text:
-                        continue
-                    if "Year" not in specs and YEAR_RE.match(text):
-                        specs["Year"] = text
-                    elif "Mileage" not in specs and MILEAGE_RE.search(text):
-                        specs["Mileage"] = text
-                except Exception:
-                    continue
-        except Exception:
-            pass
+def build_specs(rows) -> dict:
+    """Maps (label, value, brand) spec rows to output columns; first hit wins.
 
+    `brand` is only set on the "model" row, where it is the p-brand span text.
+    """
+    specs = {}
+    for label, value, brand in rows:
+        if label == "model":
+            if brand and "MakeFromRow" not in specs:
+                specs["MakeFromRow"] = brand
+            if "ModelSuffix" not in specs:
+                specs["ModelSuffix"] = value.replace(brand, "").strip()
+            continue
+
+        if not value:
+            continue
+
+        if label == "engine":
+            fuel, engine_size = split_fuel_engine(value)
+            if fuel and "Fuel" not in specs:
+                specs["Fuel"] = fuel
+            if engine_size and "Engine" not in specs:
+                specs["Engine"] = engine_size
+            continue
+
+        col = LABEL_MAP.get(label) if label in _LABEL_SET else None
+        if col and col not in specs:
+            specs[col] = value
     return specs
 
 
-def read_images(driver) -> str:
+def fill_year_mileage(specs: dict, texts):
+    """Fallback for Year & Mileage from loose body texts."""
+    for text in texts:
+        if not text:
+            continue
+        if "Year" not in specs and YEAR_RE.match(text):
+            specs["Year"] = text
+        elif "Mileage" not in specs and MILEAGE_RE.search(text):
+            specs["Mileage"] = text
+
+
+def join_images(srcs) -> str:
+    """Upgrades CDN thumbnails to full size and drops repeats of the same photo."""
     images, seen_hashes = [], set()
-    try:
-        for img in driver.find_elements(By.CSS_SELECTOR, ".MuiStack-root img"):
-            try:
-                src = img.get_attribute("src") or img.get_attribute("data-src") or ""
-                if not src or "content.deal-drive.com" not in src:
-                    continue
-                full_url = transform_image_url(src)
-                m   = re.search(r'/thumbs/([a-f0-9]+)/', full_url)
-                key = m.group(1) if m else full_url
-                if key not in seen_hashes:
-                    seen_hashes.add(key)
-                    images.append(full_url)
-            except Exception:
-                continue
-    except Exception:
-        pass
+    for src in srcs:
+        if not src or "content.deal-drive.com" not in src:
+            continue
+        full_url, key = normalize_image_url(src)
+        if key not in seen_hashes:
+            seen_hashes.add(key)
+            images.append(full_url)
     return ",".join(images)
 
 
+# Everything the scraper needs from a rendered ad page, gathered in the browser
+# and returned as one JSON string — a single WebDriver round-trip per ad.
+AD_PAGE_JS = r"""
+// textContent with whitespace collapsed, exactly like node_text() on static HTML
+const txt = el => el ? el.textContent.replace(/\s+/g, ' ').trim() : '';
+const rows = [];
+for (const row of document.querySelectorAll('.MuiCardContent-root .mui-1d58shw')) {
+    const labelEl = row.querySelector('span.MuiTypography-body2');
+    if (!labelEl) continue;
+    const labelSpans = labelEl.querySelectorAll('span');
+    const label = txt(labelSpans.length ? labelSpans[labelSpans.length - 1] : labelEl).toLowerCase();
+    if (!label) continue;
+
+    const valueEl = row.querySelector('span.MuiTypography-body1');
+    if (!valueEl) continue;
+    if (label === 'model') {
+        const brandEl = valueEl.querySelector('span.p-brand');
+        if (brandEl) rows.push([label, txt(valueEl), txt(brandEl)]);
+        continue;
+    }
+
+    let value = txt(valueEl);
+    if (label === 'body color') {
+        const colorEl = valueEl.querySelector('span.MuiTypography-body2');
+        if (colorEl) value = txt(colorEl);
+    } else if (label === 'body type') {
+        const boxes = [...valueEl.querySelectorAll('div.MuiBox-root')].map(txt);
+        if (boxes.length) value = boxes.filter(Boolean).join(' ');
+    }
+    rows.push([label, value, '']);
+}
+
+// Year & Mileage fallback, same tests as YEAR_RE / MILEAGE_RE
+const bodies = [...document.querySelectorAll('.MuiCardContent-root span.MuiTypography-body1')].map(txt);
+const priceEl = document.querySelector('data');
+return JSON.stringify({
+    brand  : txt(document.querySelector('span.p-brand')),
+    name   : txt(document.querySelector('span.p-name')),
+    price  : priceEl ? (priceEl.getAttribute('value') || txt(priceEl)) : '',
+    rows   : rows,
+    year   : bodies.find(t => /^(19[5-9]\d|20[0-3]\d)$/.test(t)) || '',
+    mileage: bodies.find(t => /km/i.test(t)) || '',
+    images : [...document.querySelectorAll('.MuiStack-root img')]
+                 .map(img => img.src || img.dataset.src || ''),
+});
+"""
+
+
+def read_ad_page(driver) -> dict:
+    return json_loads(driver.execute_script(AD_PAGE_JS))
+
+
+# ── Static-HTML equivalent of AD_PAGE_JS ─────────────────────────────────────
+def _descendants(node, selector) -> list:
+    return [n for n in node.css(selector) if n.mem_id != node.mem_id]
+
+
+def read_spec_rows_html(tree) -> list:
+    rows = []
+    for row in tree.css(".MuiCardContent-root .mui-1d58shw"):
+        label_el = row.css_first("span.MuiTypography-body2")
+        if label_el is None:
+            continue
+        label_spans = _descendants(label_el, "span")
+        label = node_text(label_spans[-1] if label_spans else label_el).lower()
+        if not label:
+            continue
+
+        value_el = row.css_first("span.MuiTypography-body1")
+        if label == "model":
+            brand_el = value_el.css_first("span.p-brand") if value_el is not None else None
+            if brand_el is not None:
+                rows.append((label, node_text(value_el), node_text(brand_el)))
+            continue
+        if value_el is None:
+            continue
+
+        value = node_text(value_el)
+        if label == "body color":
+            color_el = _descendants(value_el, "span.MuiTypography-body2")
+            if color_el:
+                value = node_text(color_el[0])
+        elif label == "body type":
+            boxes = [node_text(b) for b in value_el.css("div.MuiBox-root")]
+            if boxes:
+                value = " ".join(b for b in boxes if b)
+        rows.append((label, value, ""))
+    return rows
+
+
+def parse_ad_html(ad_url: str, html: str) -> tuple:
+    tree  = HTMLParser(html)
+    specs = build_specs(read_spec_rows_html(tree))
+    if not specs:
+        raise ValueError("No spec rows in static HTML")
+    if "Year" not in specs or "Mileage" not in specs:
+        fill_year_mileage(specs, (node_text(n) for n in
+                                  tree.css(".MuiCardContent-root span.MuiTypography-body1")))
+
+    srcs   = (img.attributes.get("src") or img.attributes.get("data-src")
+              for img in tree.css(".MuiStack-root img"))
+    images = join_images(urljoin(ad_url, src) for src in srcs if src)   # absolute, like img.src
+
+    def first_text(selector):
+        node = tree.css_first(selector)
+        return node_text(node) if node is not None else ""
+
+    price = ""
+    price_el = tree.css_first("data")
+    if price_el is not None:
+        price = price_el.attributes.get("value") or node_text(price_el)
+
+    return build_ad_row(ad_url, first_text("span.p-brand"), first_text("span.p-name"),
+                        price, specs, images)
+
+
 # =====================================================================
 # SCRAPE SINGLE AD
 # =====================================================================
-def scrape_ad_details(driver, ad_url: str) -> dict:
-    data = {"ad_url": ad_url}
+# Output column order of a scraped ad; rows travel as tuples in this order
+AD_COLUMNS = [
+    "ad_url", "Make", "Model", "Description", "Price",
+    "Color", "Year", "Mileage", "Fuel", "Engine", "Transmission", "Drive",
+    "Trim", "BodyType", "Seats", "Condition", "Owners", "Accidents",
+    "GeneralCondition", "BodyCondition", "MechanicalCondition", "InteriorCondition",
+    "Specs", "EmissionStandard", "Images",
+]
+SPEC_COLUMNS = AD_COLUMNS[5:-1]     # copied straight from build_specs()
+_COL         = {col: i for i, col in enumerate(AD_COLUMNS)}
+
+
+def build_ad_row(ad_url: str, brand: str, p_name: str, price: str,
+                 specs: dict, images: str) -> tuple:
+    make = brand or specs.get("MakeFromRow", "")
+    model_suffix = specs.get("ModelSuffix", "")
+    if p_name:
+        model = p_name
+    elif make and model_suffix:
+        model = f"{make} {model_suffix}".strip()
+    else:
+        model = model_suffix or make
+
+    if not make and not model and not price:
+        raise ValueError("All core fields empty")
 
+    return (ad_url, make, model, model, price,
+            *(specs.get(col, "") for col in SPEC_COLUMNS),
+            images)
+
+
+def empty_ad_row(ad_url: str) -> tuple:
+    return (ad_url,) + ("",) * (len(AD_COLUMNS) - 1)
+
+
+def rows_to_frame(rows: list) -> pd.DataFrame:
+    """Builds the DataFrame column by column from AD_COLUMNS-ordered tuples."""
+    cols = zip(*rows) if rows else [()] * len(AD_COLUMNS)
+    return pd.DataFrame(dict(zip(AD_COLUMNS, map(list, cols))))
+
+
+def log_ok(row: tuple):
+    make, model, price = row[_COL["Make"]], row[_COL["Model"]], row[_COL["Price"]]
+    log(f"    [OK] {make} {model} | {price} | Y:{row[_COL['Year']]} | KM:{row[_COL['Mileage']]} | Fuel:{row[_COL['Fuel']]} | Color:{row[_COL['Color']]}")
+
+
+def scrape_ad_http(client, ad_url: str):
+    """Scrapes an ad from its static HTML; None when the page needs a browser.
+
+    Fetch errors are raised, as they don't show whether the page renders
+    without JavaScript.
+    """
+    html = fetch_html(client, ad_url)
+    try:
+        data = parse_ad_html(ad_url, html)
+    except Exception as e:
+        log(f"  [~] Static HTML unusable — {ad_url} -> {e}")
+        return None
+    log_ok(data)
+    return data
+
+
+def scrape_ad_details(driver, ad_url: str) -> tuple:
     for attempt in range(1, MAX_RETRIES + 1):
         try:
             driver.get(ad_url)
             if not wait_for_ad_detail(driver):
                 raise TimeoutException(f"Page not ready after {WAIT_AD}s")
 
-            specs  = read_all_specs(driver)
-            images = read_images(driver)
-
-            make = safe_get(driver, "span.p-brand") or specs.get("MakeFromRow", "")
-            model_suffix = specs.get("ModelSuffix", "")
-            p_name = safe_get(driver, "span.p-name")
-            if p_name:
-                model = p_name
-            elif make and model_suffix:
-                model = f"{make} {model_suffix}".strip()
-            else:
-                model = model_suffix or make
+            page  = read_ad_page(driver)
+            specs = build_specs(page["rows"])
+            if page["year"]:
+                specs.setdefault("Year", page["year"])
+            if page["mileage"]:
+                specs.setdefault("Mileage", page["mileage"])
 
-            price = ""
-            try:
-                el    = driver.find_element(By.CSS_SELECTOR, "data")
-                price = el.get_attribute("value") or el.text.strip()
-            except NoSuchElementException:
-                pass
-
-            if not make and not model and not price:
-                raise ValueError("All core fields empty")
-
-            data.update({
-                "Make"               : make,
-                "Model"              : model,
-                "Description"        : model,
-                "Price"              : price,
-                "Color"              : specs.get("Color", ""),
-                "Year"               : specs.get("Year", ""),
-                "Mileage"            : specs.get("Mileage", ""),
-                "Fuel"               : specs.get("Fuel", ""),
-                "Engine"             : specs.get("Engine", ""),
-                "Transmission"       : specs.get("Transmission", ""),
-                "Drive"              : specs.get("Drive", ""),
-                "Trim"               : specs.get("Trim", ""),
-                "BodyType"           : specs.get("BodyType", ""),
-                "Seats"              : specs.get("Seats", ""),
-                "Condition"          : specs.get("Condition", ""),
-                "Owners"             : specs.get("Owners", ""),
-                "Accidents"          : specs.get("Accidents", ""),
-                "GeneralCondition"   : specs.get("GeneralCondition", ""),
-                "BodyCondition"      : specs.get("BodyCondition", ""),
-                "MechanicalCondition": specs.get("MechanicalCondition", ""),
-                "InteriorCondition"  : specs.get("InteriorCondition", ""),
-                "Specs"              : specs.get("Specs", ""),
-                "EmissionStandard"   : specs.get("EmissionStandard", ""),
-                "Images"             : images,
-            })
-
-            log(f"    [OK] {make} {model} | {price} | Y:{data['Year']} | KM:{data['Mileage']} | Fuel:{data['Fuel']} | Color:{data['Color']}")
+            data = build_ad_row(ad_url, page["brand"], page["name"], page["price"],
+                                specs, join_images(page["images"]))
+            log_ok(data)
             return data
 
         except Exception as e:
@@ -374,16 +588,7 @@ def scrape_ad_details(driver, ad_url: str) -> dict:
                 time.sleep(RETRY_WAIT)
 
     log(f"  [✗] FAILED: {ad_url}")
-    data.update({
-        "Make": "", "Model": "", "Description": "", "Price": "",
-        "Color": "", "Year": "", "Mileage": "", "Fuel": "",
-        "Engine": "", "Transmission": "", "Drive": "", "Trim": "",
-        "BodyType": "", "Seats": "", "Condition": "", "Owners": "",
-        "Accidents": "", "GeneralCondition": "", "BodyCondition": "",
-        "MechanicalCondition": "", "InteriorCondition": "",
-        "Specs": "", "EmissionStandard": "", "Images": "",
-    })
-    return data
+    return empty_ad_row(ad_url)
 
 
 # =====================================================================
@@ -394,23 +599,97 @@ def get_csv_path(today: str) -> str:
     return os.path.join(SAVE_DIR, f"{today}.csv")
 
 
+def get_parquet_path(csv_path: str) -> str:
+    return os.path.splitext(csv_path)[0] + ".parquet"
+
+
 def find_latest_csv(exclude_date: str = ""):
+    """Newest saved run; its Parquet copy wins over the CSV of the same date."""
     if not os.path.isdir(SAVE_DIR):
         return None
-    csvs = [(f[:-4], os.path.join(SAVE_DIR, f))
-            for f in os.listdir(SAVE_DIR)
-            if f.endswith(".csv") and f[:-4] != exclude_date]
-    if not csvs:
-        return None
-    return sorted(csvs, key=lambda x: x[0], reverse=True)[0][1]
+    with os.scandir(SAVE_DIR) as entries:
+        latest = max(((stem, ext == ".parquet", e.path)
+                      for e in entries
+                      for stem, ext in [os.path.splitext(e.name)]
+                      if ext in (".csv", ".parquet") and stem != exclude_date),
+                     default=None)
+    return latest[2] if latest else None
+
+
+def read_saved_run(path: str) -> pd.DataFrame:
+    df = None
+    if path.endswith(".parquet"):
+        try:
+            df = pd.read_parquet(path).fillna("")
+        except ImportError:     # no pyarrow here — the CSV of the same run is always saved too
+            path = os.path.splitext(path)[0] + ".csv"
+    if df is None:
+        df = pd.read_csv(path, dtype=str).fillna("")
+    if "Status" in df.columns:
+        df["Status"] = df["Status"].astype("category")     # four distinct values
+    return df
+
+
+def load_previous_run(today: str):
+    """Reads the newest earlier run once for both reuse and reconcile.
+
+    Returns (path, DataFrame), or (None, None) when there is none or it can't be read.
+    Every column is loaded: reused and REMOVED rows are carried over whole.
+    """
+    prev_path = find_latest_csv(exclude_date=today)
+    if prev_path is None:
+        return None, None
+    try:
+        return prev_path, read_saved_run(prev_path)
+    except Exception as e:
+        log(f"  Could not read previous file {prev_path} ({e}) — ignoring it.")
+        return None, None
+
+
+def save_run(df: pd.DataFrame, csv_path: str):
+    """Writes the CSV (the report) plus a Parquet copy for fast reload next run."""
+    df.to_csv(csv_path, index=False, chunksize=10_000)
+    parquet_path = get_parquet_path(csv_path)
+    tmp_path     = parquet_path + ".tmp"
+    try:
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, parquet_path)
+    except Exception as e:
+        log(f"  [!] Parquet copy not written ({e})")
+        # An older Parquet of the same date would win over this CSV next run
+        for path in (tmp_path, parquet_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def reuse_unchanged_ads(ad_tiles: dict, prev_df):
+    """Splits collected ads into (urls to scrape, previous rows to reuse).
 
+    An ad is reused when the last run saw it active at the same, non-empty
+    price as its listing tile shows now.
+    """
+    if prev_df is None or not SKIP_UNCHANGED:
+        return list(ad_tiles), pd.DataFrame()
 
-def reconcile(new_df: pd.DataFrame, today: str) -> pd.DataFrame:
+    active_prev = prev_df[prev_df["Status"].str.upper() != "REMOVED"].drop_duplicates("ad_url")
+    active_prev = active_prev.set_index("ad_url")
+
+    tile_price = pd.Series(ad_tiles, dtype=object)
+    prev_price = active_prev["Price"].reindex(tile_price.index)
+    same       = (tile_price != "") & (tile_price == prev_price)
+
+    reused = (active_prev.loc[tile_price.index[same]]
+              .reindex(columns=AD_COLUMNS[1:], fill_value="")
+              .rename_axis("ad_url")
+              .reset_index())
+    return tile_price.index[~same].tolist(), reused
+
+
+def reconcile(new_df: pd.DataFrame, today: str, prev_path, prev_df) -> pd.DataFrame:
     new_df           = new_df.copy()
     new_df[DATE_COL] = today
 
-    prev_path = find_latest_csv(exclude_date=today)
-    if prev_path is None:
+    if prev_df is None:
         log(f"  No previous data — marking all {len(new_df)} ads as NEW.")
         new_df["Status"]         = "NEW"
         new_df["Change_Details"] = ""
@@ -418,46 +697,30 @@ def reconcile(new_df: pd.DataFrame, today: str) -> pd.DataFrame:
         new_df["Prev_Mileage"]   = ""
         return new_df
 
-    try:
-        prev_df = pd.read_csv(prev_path, dtype=str).fillna("")
-    except Exception as e:
-        log(f"  Could not read previous file ({e}) — marking all as NEW.")
-        new_df["Status"]         = "NEW"
-        new_df["Change_Details"] = ""
-        new_df["Prev_Price"]     = ""
-        new_df["Prev_Mileage"]   = ""
-        return new_df
-
     log(f"  Comparing against: {prev_path}  ({len(prev_df)} rows)")
     active_prev = prev_df[prev_df["Status"].str.upper() != "REMOVED"].set_index("ad_url")
 
     new_df.set_index("ad_url", inplace=True)
-    new_df["Status"]         = "NEW"
-    new_df["Change_Details"] = ""
-    new_df["Prev_Price"]     = ""
-    new_df["Prev_Mileage"]   = ""
-
-    for url in new_df.index:
-        if url in active_prev.index:
-            old_price   = active_prev.at[url, "Price"]   if "Price"   in active_prev.columns else ""
-            old_mileage = active_prev.at[url, "Mileage"] if "Mileage" in active_prev.columns else ""
-            new_price   = str(new_df.at[url, "Price"])
-            new_mileage = str(new_df.at[url, "Mileage"])
-            price_changed   = old_price   != new_price
-            mileage_changed = old_mileage != new_mileage
-
-            if not price_changed and not mileage_changed:
-                new_df.at[url, "Status"] = "UNCHANGED"
-            else:
-                new_df.at[url, "Status"] = "UPDATED"
-                changes = []
-                if price_changed:
-                    changes.append(f"Price: {old_price} -> {new_price}")
-                if mileage_changed:
-                    changes.append(f"Mileage: {old_mileage} -> {new_mileage}")
-                new_df.at[url, "Change_Details"] = " | ".join(changes)
-                new_df.at[url, "Prev_Price"]     = old_price
-                new_df.at[url, "Prev_Mileage"]   = old_mileage
+
+    # Previous Price/Mileage aligned to today's ads ("" where not seen before)
+    prev_vals = active_prev.reindex(columns=["Price", "Mileage"], fill_value="")
+    prev_vals = prev_vals[~prev_vals.index.duplicated()].reindex(new_df.index).fillna("")
+    old_price,   new_price   = prev_vals["Price"],   new_df["Price"].astype(str)
+    old_mileage, new_mileage = prev_vals["Mileage"], new_df["Mileage"].astype(str)
+
+    in_prev         = pd.Series(new_df.index.isin(active_prev.index), index=new_df.index)
+    price_changed   = in_prev & (old_price   != new_price)
+    mileage_changed = in_prev & (old_mileage != new_mileage)
+    updated         = price_changed | mileage_changed
+
+    price_note   = ("Price: "   + old_price   + " -> " + new_price).where(price_changed, "")
+    mileage_note = ("Mileage: " + old_mileage + " -> " + new_mileage).where(mileage_changed, "")
+    separator    = pd.Series(" | ", index=new_df.index).where(price_changed & mileage_changed, "")
+
+    new_df["Status"]         = np.select([~in_prev, updated], ["NEW", "UPDATED"], default="UNCHANGED")
+    new_df["Change_Details"] = price_note + separator + mileage_note
+    new_df["Prev_Price"]     = old_price.where(updated, "")
+    new_df["Prev_Mileage"]   = old_mileage.where(updated, "")
 
     removed_urls = active_prev.index.difference(new_df.index)
     if len(removed_urls):
@@ -490,12 +753,19 @@ def print_reconcile_summary(df: pd.DataFrame):
 # =====================================================================
 # EMAIL
 # =====================================================================
+def gzip_file(path: str) -> str:
+    """Compresses `path` to `path.gz` in fixed-size chunks; returns the new path."""
+    gz_path = path + ".gz"
+    with open(path, "rb") as fi, gzip.open(gz_path, "wb", compresslevel=6) as fo:
+        shutil.copyfileobj(fi, fo)
+    return gz_path
+
+
 def send_email(csv_path: str, summary: dict, today: str):
-    if not EMAIL_ENABLED:
-        log("  Email disabled — skipping.")
-        return
+    """Sends the report; the CSV is only read and compressed here, so callers
+    check EMAIL_ENABLED first."""
     try:
-        msg            = MIMEMultipart()
+        msg            = EmailMessage()
         msg["From"]    = EMAIL_SENDER
         msg["To"]      = ", ".join(EMAIL_TO)
         msg["Subject"] = f"Linda Cars — Weekly Scrape {today}"
@@ -508,21 +778,22 @@ def send_email(csv_path: str, summary: dict, today: str):
             f"  UNCHANGED  : {summary.get('UNCHANGED', 0)}",
             f"  REMOVED    : {summary.get('REMOVED', 0)}",
             f"  TOTAL ROWS : {summary.get('TOTAL', 0)}", "",
-            "The full CSV is attached.", "",
+            "The full CSV is attached (gzip-compressed).", "",
             "— Linda Cars Scraper (automated)",
         ]
-        msg.attach(MIMEText("\n".join(body_lines), "plain"))
+        msg.set_content("\n".join(body_lines))
 
-        with open(csv_path, "rb") as f:
-            part = MIMEBase("application", "octet-stream")
-            part.set_payload(f.read())
-        encoders.encode_base64(part)
-        part.add_header("Content-Disposition", f'attachment; filename="{os.path.basename(csv_path)}"')
-        msg.attach(part)
+        gz_path = gzip_file(csv_path)
+        try:
+            with open(gz_path, "rb") as f:
+                msg.add_attachment(f.read(), maintype="application", subtype="gzip",
+                                   filename=os.path.basename(gz_path))
+        finally:
+            os.remove(gz_path)
 
         with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
             server.login(EMAIL_SENDER, EMAIL_PASSWORD)
-            server.sendmail(EMAIL_SENDER, EMAIL_TO, msg.as_string())
+            server.send_message(msg, from_addr=EMAIL_SENDER, to_addrs=EMAIL_TO)
 
         log(f"  Email sent to: {', '.join(EMAIL_TO)}")
     except Exception as e:
@@ -531,49 +802,215 @@ def send_email(csv_path: str, summary: dict, today: str):
 
 
 # =====================================================================
-# MAIN — single Chrome instance, sequential scraping
+# WORKER POOL — each process owns its own HTTP client and (lazily) a Chrome
+# tab — in the shared browser, or in a Chrome of its own
 # =====================================================================
-def main():
-    today    = datetime.date.today().isoformat()
-    csv_path = get_csv_path(today)
+_client           = None
+_driver           = None
+_driver_finalizer = None
+_worker_id        = 0
+_debugger_address = None
+_driver_lock      = None
+_http_ads_ok      = True    # cleared once an ad page turns out to need JavaScript
+
+
+def _init_worker(worker_counter, debugger_address, driver_lock):
+    """Pool initializer: give this process an id and an HTTP client.
+
+    Pool workers leave through os._exit, so atexit hooks never fire there;
+    a multiprocessing Finalize runs on the worker's normal shutdown instead.
+    """
+    global _client, _worker_id, _debugger_address, _driver_lock
+    with worker_counter.get_lock():
+        _worker_id = worker_counter.value
+        worker_counter.value += 1
+    _debugger_address = debugger_address
+    _driver_lock      = driver_lock
+    _client = init_http_client()
+    if _client is not None:
+        Finalize(_client, _client.close, exitpriority=10)
+
+
+def _release_driver(driver):
+    if _debugger_address:
+        driver.close()      # only this worker's tab; the shared browser is quit by main()
+    driver.quit()
+
+
+def _get_driver() -> webdriver.Chrome:
+    """Opens this process's browser tab on first use — only JS-rendered pages need it."""
+    global _driver, _driver_finalizer
+    if _driver is None:
+        # Drivers start one at a time (no launch/attach races), then scrape concurrently
+        with _driver_lock:
+            _driver = init_driver(_worker_id, _debugger_address)
+        _driver_finalizer = Finalize(_driver, _release_driver, args=(_driver,), exitpriority=10)
+    return _driver
+
+
+def _drop_driver():
+    """Closes this process's browser tab now; the next _get_driver() opens a new one."""
+    global _driver
+    if _driver is not None:
+        _driver_finalizer()
+        _driver = None
+
+
+def _check_http_listing() -> bool:
+    """True when plain HTTP serves the listing the way Chrome renders it.
+
+    Page 0 must have tiles over HTTP, and page 1 must hold the same ads over
+    HTTP as in Chrome — this catches server HTML that ignores `page=` and
+    would otherwise end the crawl after the first page. The Chrome used here
+    is closed again straight away.
+    """
+    if _client is None:
+        return False
+    try:
+        page0_http    = page_tiles_http(_client, f"{START_URL}0")
+        page1_http    = page_tiles_http(_client, f"{START_URL}1")
+        page1_browser = page_tiles_browser(_get_driver(), f"{START_URL}1")
+    except Exception as e:
+        log(f"  [!] Could not compare HTTP and Chrome listings ({e}).")
+        return False
+    finally:
+        _drop_driver()
+    return bool(page0_http) and tile_urls(page1_http) == tile_urls(page1_browser)
 
-    driver = init_driver()
-    results = []
 
+def _check_http_ad(ad_url: str) -> bool:
+    """True when an ad parsed from static HTML matches the Chrome-rendered one.
+
+    Catches fields that only appear after rendering, such as images loaded
+    client-side. The Chrome used here is closed again straight away.
+    """
+    if _client is None:
+        return False
+    try:
+        data = scrape_ad_http(_client, ad_url)
+        if data is None:
+            return False
+        return data == scrape_ad_details(_get_driver(), ad_url)
+    except Exception as e:
+        log(f"  [!] Could not compare HTTP and Chrome ad pages ({e}).")
+        return False
+    finally:
+        _drop_driver()
+
+
+def _collect_page(page: int, use_http: bool) -> list:
+    url = f"{START_URL}{page}"
+    log(f"  Collecting page {page}: {url}")
+    if use_http:
+        try:
+            return page_tiles_http(_client, url)
+        except Exception as e:
+            log(f"  [!] HTTP listing fetch failed ({e}) — using Chrome.")
+    return page_tiles_browser(_get_driver(), url)
+
+
+def _scrape_one(ad_url: str, use_http: bool) -> tuple:
+    global _http_ads_ok
+    log(f"  [pid {os.getpid()}] {ad_url}")
+    if use_http and _http_ads_ok:
+        try:
+            data = scrape_ad_http(_client, ad_url)
+        except Exception as e:
+            log(f"  [~] HTTP fetch failed — {ad_url} -> {e}")
+        else:
+            if data is not None:
+                return data
+            _http_ads_ok = False
+            log("  [~] Ad pages need JavaScript — this worker uses Chrome from now on.")
     try:
-        # Phase 1: collect all URLs
-        log("=== PHASE 1: Collecting ad URLs ===")
-        ad_urls = collect_ad_urls(driver)
-        total   = len(ad_urls)
-        log(f"\n  Total ads found: {total}")
-
-        if total == 0:
-            log("  No ads found — aborting.")
-            return
-
-        # Phase 2: scrape all ads with the same browser instance (no restart overhead)
-        log(f"\n=== PHASE 2: Scraping {total} ads ===")
-        for idx, ad_url in enumerate(ad_urls, 1):
-            log(f"  [{idx}/{total}] {ad_url}")
-            results.append(scrape_ad_details(driver, ad_url))
+        driver = _get_driver()
+    except Exception as e:
+        log(f"  [✗] FAILED: {ad_url} -> could not start Chrome: {e}")
+        return empty_ad_row(ad_url)
+    return scrape_ad_details(driver, ad_url)
+
+
+# =====================================================================
+# MAIN
+# =====================================================================
+def scrape_all(pool, prev_df):
+    """Phases 1 & 2 on an open pool; returns (scraped rows, reused rows), or None if no ads."""
+    # Phase 1: collect all URLs
+    log("=== PHASE 1: Collecting ad URLs ===")
+    ad_tiles = collect_ad_urls(pool)
+    total    = len(ad_tiles)
+    log(f"\n  Total ads found: {total}")
+
+    if total == 0:
+        log("  No ads found — aborting.")
+        return None
+
+    ad_urls, reused = reuse_unchanged_ads(ad_tiles, prev_df)
+    if len(reused):
+        log(f"  Reusing {len(reused)} ads with unchanged price from the previous run.")
+
+    # Phase 2: scrape the remaining ads across the pool
+    log(f"\n=== PHASE 2: Scraping {len(ad_urls)} ads with {NUM_WORKERS} workers ===")
+    use_http = (not USE_BROWSER and httpx is not None and bool(ad_urls)
+                and pool.apply(_check_http_ad, (ad_urls[0],)))
+    log(f"  Ad pages via {'HTTP' if use_http else 'Chrome'}.")
+    scrape  = partial(_scrape_one, use_http=use_http)
+    results = []
+    for idx, row in enumerate(pool.imap_unordered(scrape, ad_urls, chunksize=4), 1):
+        log(f"  [{idx}/{len(ad_urls)}] {row[0]}")
+        results.append(row)
+    return results, reused
+
 
+def main():
+    today    = datetime.date.today().isoformat()
+    csv_path = get_csv_path(today)
+    prev_path, prev_df = load_previous_run(today)
+
+    if httpx is None and not USE_BROWSER:
+        log(f"  [!] HTTP fast path disabled ({HTTP_IMPORT_ERROR}) — every page goes through Chrome.")
+
+    # One pool of NUM_WORKERS processes serves both the listing and the ad
+    # phase. When every page goes through Chrome, SHARED_BROWSER has them all
+    # drive tabs of this one Chrome; otherwise each worker starts its own
+    # Chrome only if a page turns out to need one.
+    browser_only     = USE_BROWSER or httpx is None
+    shared_browser   = init_driver() if SHARED_BROWSER and browser_only else None
+    debugger_address = (shared_browser.capabilities["goog:chromeOptions"]["debuggerAddress"]
+                        if shared_browser is not None else None)
+    try:
+        with Pool(NUM_WORKERS, initializer=_init_worker,
+                  initargs=(Value("i", 0), debugger_address, Lock())) as pool:
+            try:
+                scraped = scrape_all(pool, prev_df)
+            finally:
+                pool.close()    # let workers exit cleanly so their tabs/drivers close
+                pool.join()
     finally:
-        driver.quit()
+        if shared_browser is not None:
+            shared_browser.quit()
+
+    if scraped is None:
+        return
+    results, reused = scraped
 
     # Phase 3: reconcile & save
     log("\n=== PHASE 3: Reconciling & Saving ===")
-    raw_df   = pd.DataFrame(results)
-    final_df = reconcile(raw_df, today)
+    raw_df   = pd.concat([rows_to_frame(results), reused], ignore_index=True)
+    final_df = reconcile(raw_df, today, prev_path, prev_df)
     os.makedirs(SAVE_DIR, exist_ok=True)
-    final_df.to_csv(csv_path, index=False)
+    save_run(final_df, csv_path)
     print_reconcile_summary(final_df)
     log(f"\n  Saved -> {csv_path}  ({len(final_df)} total rows)")
 
     # Phase 4: email
     log("\n=== PHASE 4: Sending Email ===")
-    counts = final_df["Status"].value_counts().to_dict() if "Status" in final_df.columns else {}
-    counts["TOTAL"] = len(final_df)
-    send_email(csv_path, counts, today)
+    if not EMAIL_ENABLED:
+        log("  Email disabled — skipping.")
+    else:
+        counts = final_df["Status"].value_counts().to_dict() if "Status" in final_df.columns else {}
+        counts["TOTAL"] = len(final_df)
+        send_email(csv_path, counts, today)
 
     log("\nDone.")
 